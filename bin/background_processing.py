@@ -7,8 +7,12 @@ import logging
 import logging.config
 from collections import Counter
 from datetime import date, timedelta, datetime
+from functools import lru_cache
+from operator import itemgetter
 from typing import Any
 
+import orjson
+
 from lacuscore import CaptureStatus as CaptureStatusCore, CaptureSettingsError
 from lookyloo import Lookyloo
 from lookyloo.exceptions import LacusUnreachable
@@ -20,6 +24,21 @@ from pylacus import CaptureStatus as CaptureStatusPy
 logging.config.dictConfig(get_config('logging'))
 
 
+@lru_cache(maxsize=100_000)
+def _ua_platform_browser(ua: str) -> tuple[str, str] | None:
+    '''Parsing is expensive and most of the UAs are the same from one day to the next'''
+    parsed_ua = ParsedUserAgent(ua)
+    if not parsed_ua.platform or not parsed_ua.browser:
+        return None
+    platform_key = parsed_ua.platform
+    if parsed_ua.platform_version:
+        platform_key = f'{platform_key} {parsed_ua.platform_version}'
+    browser_key = parsed_ua.browser
+    if parsed_ua.version:
+        browser_key = f'{browser_key} {parsed_ua.version}'
+    return platform_key, browser_key
+
+
 class Processing(AbstractManager):
 
     def __init__(self, loglevel: int | None=None):
@@ -47,61 +66,65 @@ class Processing(AbstractManager):
     def _build_ua_file(self) -> None:
         '''Build a file in a format compatible with the capture page'''
         yesterday = (date.today() - timedelta(days=1))
+        yesterday_iso = yesterday.isoformat()
         self_generated_ua_file_path = get_homedir() / 'own_user_agents' / str(yesterday.year) / f'{yesterday.month:02}'
         safe_create_dir(self_generated_ua_file_path)
-        self_generated_ua_file = self_generated_ua_file_path / f'{yesterday.isoformat()}.json'
+        self_generated_ua_file = self_generated_ua_file_path / f'{yesterday_iso}.json'
         if self_generated_ua_file.exists():
             self.logger.debug(f'User-agent file for {yesterday} already exists.')
             return
         self.logger.info(f'Generating user-agent file for {yesterday}')
-        entries = self.lookyloo.redis.zrevrange(f'user_agents|{yesterday.isoformat()}', 0, -1)
-        if not entries:
+        ua_key = f'user_agents|{yesterday_iso}'
+        if not (nb_entries := self.lookyloo.redis.zcard(ua_key)):
             self.logger.info(f'No User-agent file for {yesterday} to generate.')
             return
 
         to_store: dict[str, Any] = {'by_frequency': []}
-        uas = Counter([entry.split('|', 1)[1] for entry in entries])
-        for ua, _ in uas.most_common():
-            parsed_ua = ParsedUserAgent(ua)
-            if not parsed_ua.platform or not parsed_ua.browser:
+        uas: Counter[str] = Counter()
+        # The set can be big on a busy instance, fetch it in chunks to avoid blocking redis.
+        for start in range(0, nb_entries, 10000):
+            uas.update(entry.partition('|')[2] for entry in self.lookyloo.redis.zrevrange(ua_key, start, start + 9999))
+        for ua, _ in sorted(uas.items(), key=itemgetter(1), reverse=True):
+            if not (ua_keys := _ua_platform_browser(ua)):
                 continue
-            platform_key = parsed_ua.platform
-            if parsed_ua.platform_version:
-                platform_key = f'{platform_key} {parsed_ua.platform_version}'
-            browser_key = parsed_ua.browser
-            if parsed_ua.version:
-                browser_key = f'{browser_key} {parsed_ua.version}'
-            if platform_key not in to_store:
-                to_store[platform_key] = {}
-            if browser_key not in to_store[platform_key]:
-                to_store[platform_key][browser_key] = set()
-            to_store[platform_key][browser_key].add(parsed_ua.string)
+            platform_key, browser_key = ua_keys
+            to_store.setdefault(platform_key, {}).setdefault(browser_key, set()).add(ua)
             to_store['by_frequency'].append({'os': platform_key,
                                              'browser': browser_key,
-                                             'useragent': parsed_ua.string})
-        with self_generated_ua_file.open('w') as f:
-            json.dump(to_store, f, indent=2, default=serialize_to_json)
+                                             'useragent': ua})
+        with self_generated_ua_file.open('wb') as f:
+            f.write(orjson.dumps(to_store, default=serialize_to_json, option=orjson.OPT_INDENT_2))
 
         # Remove the UA / IP mapping.
-        self.lookyloo.redis.delete(f'user_agents|{yesterday.isoformat()}')
+        self.lookyloo.redis.unlink(ua_key)
         self.logger.info(f'User-agent file for {yesterday} generated.')
 
     def _retry_failed_enqueue(self) -> None:
         '''If enqueuing failed, the settings are added, with a UUID in the 'to_capture key', and they have a UUID'''
         to_requeue: list[str] = []
+        to_check = self.lookyloo.redis.zrevrangebyscore('to_capture', 'Inf', '-Inf', start=0, num=500)
+        if not to_check:
+            return None
+        # Fetch the lookyloo side of the state for all the UUIDs in one round trip
+        p = self.lookyloo.redis.pipeline()
+        for uuid in to_check:
+            p.exists(uuid)
+            p.sismember('ongoing', uuid)
+            p.hget(uuid, 'not_queued')
+        states = p.execute()
         try:
-            for uuid in self.lookyloo.redis.zrevrangebyscore('to_capture', 'Inf', '-Inf', start=0, num=500):
-                if not self.lookyloo.redis.exists(uuid):
+            for uuid, settings_exist, ongoing, not_queued in zip(to_check, states[::3], states[1::3], states[2::3]):
+                if not settings_exist:
                     self.logger.warning(f'The settings for {uuid} are missing, there is nothing we can do.')
                     self.lookyloo.redis.zrem('to_capture', uuid)
                     continue
-                if self.lookyloo.redis.sismember('ongoing', uuid):
+                if ongoing:
                     # Finishing up on lookyloo side, ignore.
                     continue
 
                 if self.lookyloo._get_lacus_capture_status(uuid) in [CaptureStatusPy.UNKNOWN, CaptureStatusCore.UNKNOWN]:
                     # The capture is unknown on lacus side, but we have it in the to_capture queue *and* we still have the settings on lookyloo side
-                    if self.lookyloo.redis.hget(uuid, 'not_queued') == '1':
+                    if not_queued == '1':
                         # The capture has already been marked as not queued
                         to_requeue.append(uuid)
                     else:
@@ -115,14 +138,21 @@ class Processing(AbstractManager):
             self.logger.warning('Lacus still unreachable, trying again later')
             return None
 
+        if not to_requeue:
+            return None
+        p = self.lookyloo.redis.pipeline()
         for uuid in to_requeue:
-            if self.lookyloo.redis.zscore('to_capture', uuid) is None:
+            p.zscore('to_capture', uuid)
+            p.hgetall(uuid)
+        requeue_states = p.execute()
+        for uuid, score, capture_settings in zip(to_requeue, requeue_states[::2], requeue_states[1::2]):
+            if score is None:
                 # The capture has been captured in the meantime.
                 continue
             self.logger.info(f'Found a non-queued capture ({uuid}), retrying now.')
             # This capture couldn't be queued and we created the uuid locally
             try:
-                if capture_settings := self.lookyloo.redis.hgetall(uuid):
+                if capture_settings:
                     query = CaptureSettings(**capture_settings)
                     # Make sure the UUID is set in the settings so we don't get a new one.
                     query.uuid = uuid
@@ -276,7 +276,7 @@ class CapturesIndex(Mapping):  # type: ignore[type-arg]
         p = self.redis.pipeline()
         has_new_cached_captures = False
         recent_captures: dict[str, float] = {}
-        for uuid, directory in self.redis.hscan_iter('lookup_dirs'):
+        for uuid, directory in self.redis.hscan_iter('lookup_dirs', count=1024):
             if uuid in self.__cache:
                 continue
             has_new_cached_captures = True
@@ -1886,7 +1886,7 @@ class Lookyloo():
                     weeks_stats[date_submission.isocalendar()[1]]['uniq_urls'].update(cache.redirects)
 
         # Build limited stats based on archved captures and the indexes
-        for _, capture_path in self.redis.hscan_iter('lookup_dirs_archived'):
+        for _, capture_path in self.redis.hscan_iter('lookup_dirs_archived', count=1024):
             capture_ts = datetime.fromisoformat(capture_path.rsplit('/', 1)[-1])
             if capture_ts.year not in stats:
                 stats[capture_ts.year] = {}
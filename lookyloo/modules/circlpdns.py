@@ -53,11 +53,11 @@ class CIRCLPDNS(AbstractModule):
         url_storage_dir = get_cache_directory(self.storage_dir_pypdns, query, 'pdns')
         if not url_storage_dir.exists():
             return None
-        cached_entries = sorted(url_storage_dir.glob('*'), reverse=True)
-        if not cached_entries:
+        newest_entry = max(url_storage_dir.glob('*'), default=None)
+        if newest_entry is None:
             return None
 
-        with cached_entries[0].open() as f:
+        with newest_entry.open() as f:
             return [PDNSRecord(record) for record in json.load(f)]
 
     def capture_default_trigger(self, cache: CaptureCache, /, *, force: bool,
@@ -108,4 +108,4 @@ class CIRCLPDNS(AbstractModule):
             return
         pdns_info_store = [entry.raw for entry in sorted(pdns_info, key=lambda k: k.time_last_datetime, reverse=True)]
         with pypdns_file.open('w') as _f:
-            json.dump(pdns_info_store, _f)
+            _f.write(json.dumps(pdns_info_store))
@@ -90,7 +90,7 @@ class Cloudflare():
             f.write(ipv6_list + '\n')
 
         with last_updates_path.open('w') as f:
-            json.dump(last_updates, f)
+            f.write(json.dumps(last_updates))
 
     def init_lists(self) -> None:
         '''Return the IPv4 and IPv6 lists as a tuple of lists'''
@@ -52,7 +52,7 @@ class HashlookupModule(AbstractModule):
         if hits_hashlookup:
             # we got at least one hit, saving
             with store_file.open('w') as f:
-                json.dump(hits_hashlookup, f, indent=2)
+                f.write(json.dumps(hits_hashlookup, indent=2))
 
         return {'success': 'Module triggered'}
 
@@ -40,11 +40,11 @@ class Phishtank(AbstractModule):
         url_storage_dir = get_cache_directory(self.storage_dir_pt, url, 'url')
         if not url_storage_dir.exists():
             return None
-        cached_entries = sorted(url_storage_dir.glob('*'), reverse=True)
-        if not cached_entries:
+        newest_entry = max(url_storage_dir.glob('*'), default=None)
+        if newest_entry is None:
             return None
 
-        with cached_entries[0].open() as f:
+        with newest_entry.open() as f:
             return json.load(f)
 
     def lookup_ips_capture(self, cache: CaptureCache) -> dict[str, list[dict[str, Any]]]:
@@ -69,11 +69,11 @@ class Phishtank(AbstractModule):
         ip_storage_dir = get_cache_directory(self.storage_dir_pt, ip, 'ip')
         if not ip_storage_dir.exists():
             return None
-        cached_entries = sorted(ip_storage_dir.glob('*'), reverse=True)
-        if not cached_entries:
+        newest_entry = max(ip_storage_dir.glob('*'), default=None)
+        if newest_entry is None:
             return None
 
-        with cached_entries[0].open() as f:
+        with newest_entry.open() as f:
             return json.load(f)
 
     def capture_default_trigger(self, cache: CaptureCache, /, *, force: bool,
@@ -127,7 +127,7 @@ class Phishtank(AbstractModule):
             return
         to_dump = {'ip': ip, 'urls': urls}
         with pt_file.open('w') as _f:
-            json.dump(to_dump, _f)
+            _f.write(json.dumps(to_dump))
         for url in urls:
             self.__url_lookup(url)
 
@@ -155,4 +155,4 @@ class Phishtank(AbstractModule):
             return
 
         with pt_file.open('w') as _f:
-            json.dump(url_information, _f)
+            _f.write(json.dumps(url_information))
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import time
 
 from datetime import date
 from typing import Any, TYPE_CHECKING
 
+import orjson
+
 from pyeupi import PyEUPI  # type: ignore[attr-defined]
 
 from ..default import ConfigError, get_homedir
@@ -38,12 +39,12 @@ class PhishingInitiative(AbstractModule):
         url_storage_dir = get_cache_directory(self.storage_dir_eupi, url)
         if not url_storage_dir.exists():
             return None
-        cached_entries = sorted(url_storage_dir.glob('*'), reverse=True)
-        if not cached_entries:
+        newest_entry = max(url_storage_dir.glob('*'), default=None)
+        if newest_entry is None:
             return None
 
-        with cached_entries[0].open() as f:
-            return json.load(f)
+        with newest_entry.open('rb') as f:
+            return orjson.loads(f.read())
 
     def capture_default_trigger(self, cache: CaptureCache, /, *, force: bool,
                                 auto_trigger: bool, as_admin: bool) -> dict[str, str]:
@@ -96,6 +97,6 @@ class PhishingInitiative(AbstractModule):
                     scan_requested = True
                 time.sleep(1)
             else:
-                with pi_file.open('w') as _f:
-                    json.dump(url_information, _f)
+                with pi_file.open('wb') as _f:
+                    _f.write(orjson.dumps(url_information))
                 break
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
-import json
 import logging
+import os
 from datetime import date
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import orjson
 
 from pysanejs import SaneJS  # type: ignore[attr-defined]
 
@@ -35,6 +39,10 @@ class SaneJavaScript():
         self.storage_dir.mkdir(parents=True, exist_ok=True)
         self.available = True
 
+    def _read_cached(self, path: Path) -> list[str]:
+        with path.open('rb') as f:
+            return orjson.loads(f.read())
+
     def hashes_lookup(self, sha512: Iterable[str] | str, force: bool=False) -> dict[str, list[str]]:
         if not self.available:
             raise LookylooException('SaneJS is not available.')
@@ -47,10 +55,12 @@ class SaneJavaScript():
         today_dir = self.storage_dir / date.today().isoformat()
         today_dir.mkdir(parents=True, exist_ok=True)
         sanejs_unknowns = today_dir / 'unknown'
-        unknown_hashes = set()
+        unknown_hashes: set[str] = set()
         if sanejs_unknowns.exists():
-            with sanejs_unknowns.open() as f:
-                unknown_hashes = {line.strip() for line in f.readlines()}
+            unknown_hashes = set(sanejs_unknowns.read_text().split())
+
+        # One directory listing instead of a stat per hash.
+        cached_hashes = {entry.name for entry in os.scandir(today_dir)}
 
         to_return: dict[str, list[str]] = {}
 
@@ -58,8 +68,8 @@ class SaneJavaScript():
             to_lookup = hashes
         else:
             to_lookup = [h for h in hashes if (h not in unknown_hashes
-                                               and not (today_dir / h).exists())]
-        has_new_unknown = False
+                                               and h not in cached_hashes)]
+        new_unknowns: list[str] = []
         for h in to_lookup:
             try:
                 response = self.client.sha512(h)
@@ -72,23 +82,24 @@ class SaneJavaScript():
                 break
             if 'response' in response and response['response']:
                 cached_path = today_dir / h
-                with cached_path.open('w') as f:
-                    json.dump(response['response'], f)
+                with cached_path.open('wb') as f:
+                    f.write(orjson.dumps(response['response']))
                 to_return[h] = response['response']
-            else:
-                has_new_unknown = True
+            elif h not in unknown_hashes:
+                new_unknowns.append(h)
                 unknown_hashes.add(h)
 
-        for h in hashes:
-            cached_path = today_dir / h
-            if h in unknown_hashes or h in to_return:
-                continue
-            elif cached_path.exists():
-                with cached_path.open() as f:
-                    to_return[h] = json.load(f)
-
-        if has_new_unknown:
-            with sanejs_unknowns.open('w') as f:
-                f.writelines(f'{h}\n' for h in unknown_hashes)
+        to_read = {h for h in hashes if (h in cached_hashes
+                                         and h not in unknown_hashes
+                                         and h not in to_return)}
+        if to_read:
+            # A capture can have a lot of resources, overlap the reads of the (small) cached files.
+            with ThreadPoolExecutor(max_workers=min(8, len(to_read))) as executor:
+                to_return.update(zip(to_read, executor.map(self._read_cached, (today_dir / h for h in to_read))))
+
+        if new_unknowns:
+            # Only append the new ones, the file can get big on a busy day.
+            with sanejs_unknowns.open('a') as f:
+                f.write(''.join(f'{h}\n' for h in new_unknowns))
 
         return to_return
@@ -39,11 +39,11 @@ class URLhaus(AbstractModule):
         url_storage_dir = get_cache_directory(self.storage_dir_uh, url, 'url')
         if not url_storage_dir.exists():
             return None
-        cached_entries = sorted(url_storage_dir.glob('*'), reverse=True)
-        if not cached_entries:
+        newest_entry = max(url_storage_dir.glob('*'), default=None)
+        if newest_entry is None:
             return None
 
-        with cached_entries[0].open() as f:
+        with newest_entry.open() as f:
             return json.load(f)
 
     def __url_result(self, url: str) -> dict[str, Any]:
@@ -94,4 +94,4 @@ class URLhaus(AbstractModule):
             return
 
         with uh_file.open('w') as _f:
-            json.dump(url_information, _f)
+            _f.write(json.dumps(url_information))
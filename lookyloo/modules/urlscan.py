@@ -52,11 +52,11 @@ class UrlScan(AbstractModule):
             'submit')
         if not url_storage_dir.exists():
             return {}
-        cached_entries = sorted(url_storage_dir.glob('*'), reverse=True)
-        if not cached_entries:
+        newest_entry = max(url_storage_dir.glob('*'), default=None)
+        if newest_entry is None:
             return {}
 
-        with cached_entries[0].open() as f:
+        with newest_entry.open() as f:
             return json.load(f)
 
     def capture_default_trigger(self, cache: CaptureCache, /, *, force: bool,
@@ -132,7 +132,7 @@ class UrlScan(AbstractModule):
             if 'status' in response and response['status'] == 400:
                 response = {'error': response}
             with urlscan_file_submit.open('w') as _f:
-                json.dump(response, _f)
+                _f.write(json.dumps(response))
             return response
         return {'error': 'Submitting is not allowed by the configuration'}
 
@@ -154,6 +154,6 @@ class UrlScan(AbstractModule):
             except requests.exceptions.HTTPError as e:
                 return {'error': e}
             with (url_storage_dir_response / f'{uuid}.json').open('w') as _f:
-                json.dump(result, _f)
+                _f.write(json.dumps(result))
             return result
         return {'error': 'Submission incomplete or unavailable.'}
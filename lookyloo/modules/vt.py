@@ -53,15 +53,15 @@ class VirusTotal(AbstractModule):
         url_storage_dir = get_cache_directory(self.storage_dir_vt, vt.url_id(url))
         if not url_storage_dir.exists():
             return None
-        cached_entries = sorted(url_storage_dir.glob('*'), reverse=True)
-        if not cached_entries:
+        newest_entry = max(url_storage_dir.glob('*'), default=None)
+        if newest_entry is None:
             return None
 
         try:
-            with cached_entries[0].open() as f:
+            with newest_entry.open() as f:
                 return json.load(f)
         except json.decoder.JSONDecodeError:
-            cached_entries[0].unlink(missing_ok=True)
+            newest_entry.unlink(missing_ok=True)
             return None
 
     def capture_default_trigger(self, cache: CaptureCache, /, *, force: bool,
@@ -120,7 +120,7 @@ class VirusTotal(AbstractModule):
             try:
                 url_information = asyncio.run(self.__get_object_vt(url))
                 with vt_file.open('w') as _f:
-                    json.dump(url_information.to_dict(), _f, default=jsonify_vt)
+                    _f.write(json.dumps(url_information.to_dict(), default=jsonify_vt))
                 break
             except APIError as e:
                 if not self.autosubmit:
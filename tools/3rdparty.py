@@ -1,5 +1,8 @@
 #!/usr/bin/env python3
 
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 import requests
 
 from lookyloo.default import get_homedir
@@ -13,37 +16,39 @@ datatables_select_version = "3.1.0"
 jquery_json_viewer_version = "1.5.0"
 
 
+def download(session: requests.Session, url: str, destination: Path, description: str) -> None:
+    r = session.get(url, stream=True)
+    r.raise_for_status()
+    with destination.open('wb') as f:
+        for chunk in r.iter_content(chunk_size=65536):
+            f.write(chunk)
+    print(f'Downloaded {description}.')
+
+
 if __name__ == '__main__':
     dest_dir = get_homedir() / 'website' / 'web' / 'static'
-
-    d3 = requests.get(f'https://cdn.jsdelivr.net/npm/d3@{d3js_version}/dist/d3.min.js')
-    with (dest_dir / 'd3.min.js').open('wb') as f:
-        f.write(d3.content)
-        print(f'Downloaded d3js v{d3js_version}.')
-
-    jquery = requests.get(f'https://code.jquery.com/jquery-{jquery_version}.min.js')
-    with (dest_dir / 'jquery.min.js').open('wb') as f:
-        f.write(jquery.content)
-        print(f'Downloaded jquery v{jquery_version}.')
-
-    datatables_js = requests.get(f'https://cdn.datatables.net/v/bs5/dt-{datatables_version}/b-{datatables_buttons_version}/rg-{datatables_rowgroup_version}/sl-{datatables_select_version}/datatables.min.js')
-    with (dest_dir / 'datatables.min.js').open('wb') as f:
-        f.write(datatables_js.content)
-        print(f'Downloaded datatables js v{datatables_version}.')
-
-    datatables_css = requests.get(f'https://cdn.datatables.net/v/bs5/dt-{datatables_version}/b-{datatables_buttons_version}/rg-{datatables_rowgroup_version}/sl-{datatables_select_version}/datatables.min.css')
-    with (dest_dir / 'datatables.min.css').open('wb') as f:
-        f.write(datatables_css.content)
-        print(f'Downloaded datatables_css v{datatables_version}.')
-
-    jquery_json_js = requests.get(f'https://cdn.jsdelivr.net/npm/jquery.json-viewer@{jquery_json_viewer_version}/json-viewer/jquery.json-viewer.js')
-    with (dest_dir / 'jquery.json-viewer.js').open('wb') as f:
-        f.write(jquery_json_js.content)
-        print(f'Downloaded jquery_json js v{jquery_json_viewer_version}.')
-
-    jquery_json_css = requests.get(f'https://cdn.jsdelivr.net/npm/jquery.json-viewer@{jquery_json_viewer_version}/json-viewer/jquery.json-viewer.css')
-    with (dest_dir / 'jquery.json-viewer.css').open('wb') as f:
-        f.write(jquery_json_css.content)
-        print(f'Downloaded jsontree css v{jquery_json_viewer_version}.')
+    datatables_base_url = f'https://cdn.datatables.net/v/bs5/dt-{datatables_version}/b-{datatables_buttons_version}/rg-{datatables_rowgroup_version}/sl-{datatables_select_version}'
+
+    to_download = [
+        (f'https://cdn.jsdelivr.net/npm/d3@{d3js_version}/dist/d3.min.js',
+         dest_dir / 'd3.min.js', f'd3js v{d3js_version}'),
+        (f'https://code.jquery.com/jquery-{jquery_version}.min.js',
+         dest_dir / 'jquery.min.js', f'jquery v{jquery_version}'),
+        (f'{datatables_base_url}/datatables.min.js',
+         dest_dir / 'datatables.min.js', f'datatables js v{datatables_version}'),
+        (f'{datatables_base_url}/datatables.min.css',
+         dest_dir / 'datatables.min.css', f'datatables_css v{datatables_version}'),
+        (f'https://cdn.jsdelivr.net/npm/jquery.json-viewer@{jquery_json_viewer_version}/json-viewer/jquery.json-viewer.js',
+         dest_dir / 'jquery.json-viewer.js', f'jquery_json js v{jquery_json_viewer_version}'),
+        (f'https://cdn.jsdelivr.net/npm/jquery.json-viewer@{jquery_json_viewer_version}/json-viewer/jquery.json-viewer.css',
+         dest_dir / 'jquery.json-viewer.css', f'jsontree css v{jquery_json_viewer_version}'),
+    ]
+
+    with requests.Session() as session, ThreadPoolExecutor(max_workers=len(to_download)) as executor:
+        futures = [executor.submit(download, session, url, destination, description)
+                   for url, destination, description in to_download]
+        for future in futures:
+            # Re-raise any download error.
+            future.result()
 
     print('All 3rd party modules for the website were downloaded.')
@@ -62,7 +62,7 @@ from zoneinfo import available_timezones
 from .genericapi import api as generic_api
 from .helpers import (User, build_users_table, get_secret_key,
                       load_user_from_request, src_request_ip, sri_load,
-                      get_lookyloo_instance, get_indexing, build_keys_table)
+                      get_lookyloo_instance, get_indexing)
 from .proxied import ReverseProxied
 
 logging.config.dictConfig(get_config('logging'))
@@ -100,7 +100,6 @@ pkg_version = version('lookyloo')
 # Auth stuff
 login_manager = flask_login.LoginManager()
 login_manager.init_app(app)
-build_keys_table()
 
 # User agents manager
 user_agents = UserAgents()
@@ -44,20 +44,21 @@ def load_user_from_request(request: Request) -> User | None:
     api_key = request.headers.get('Authorization')
     if not api_key:
         return None
+    user_id = KEYS_TABLE.get(api_key.strip())
+    if user_id is None:
+        return None
     user = User()
-    api_key = api_key.strip()
-    keys_table = build_keys_table()
-    if api_key in keys_table:
-        user.id = keys_table[api_key]
-        return user
-    return None
+    user.id = user_id
+    return user
+
+
+_USERNAME_RE = re.compile(r'\A[A-Za-z0-9]+\Z')
 
 
 def is_valid_username(username: str) -> bool:
-    return bool(re.match("^[A-Za-z0-9]+$", username))
+    return _USERNAME_RE.match(username) is not None
 
 
-@lru_cache(64)
 def build_keys_table() -> dict[str, str]:
     keys_table: dict[str, str] = {}
     for username, authstuff in build_users_table().items():
@@ -107,17 +108,20 @@ def build_users_table() -> dict[str, dict[str, str]]:
 def get_secret_key() -> bytes:
     secret_file_path: Path = get_homedir() / 'secret_key'
     if not secret_file_path.exists() or secret_file_path.stat().st_size < 64:
-        if not secret_file_path.exists() or secret_file_path.stat().st_size < 64:
-            with secret_file_path.open('wb') as f:
-                f.write(os.urandom(64))
-    with secret_file_path.open('rb') as f:
-        return f.read()
+        secret_file_path.write_bytes(os.urandom(64))
+    return secret_file_path.read_bytes()
+
+
+# The users are loaded from the config when the website starts, this also ensures the authkeys are unique.
+KEYS_TABLE: dict[str, str] = build_keys_table()
+
+
+# The SRI hashes are generated by tools/generate_sri.py and do not change while the website runs.
+_SRI: dict[str, dict[str, str]] = orjson.loads((get_homedir() / 'website' / 'web' / 'sri.txt').read_bytes())
 
 
-@lru_cache(64)
 def sri_load() -> dict[str, dict[str, str]]:
-    with (get_homedir() / 'website' / 'web' / 'sri.txt').open('rb') as f:
-        return orjson.loads(f.read())
+    return _SRI
 
 
 def get_indexing(user: User | None) -> Indexing: